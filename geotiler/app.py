@@ -26,6 +26,7 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from geotiler import __version__
 from geotiler.config import settings
+from geotiler.templates_utils import precompile_templates
 from geotiler.middleware.azure_auth import AzureAuthMiddleware
 from geotiler.infrastructure.middleware import RequestTimingMiddleware
 from geotiler.routers import health, admin, vector, stac, diagnostics, home, catalog, reference, system, viewer, preview
@@ -108,6 +109,9 @@ async def lifespan(app: FastAPI):
             f"proxy_max_size={settings.download_proxy_max_size_mb} MB"
         )
 
+    # Warm the Jinja template cache before the first admin request
+    precompile_templates()
+
     app.state.startup_time = time.time()
     logger.info(f"Startup complete: geotiler v{__version__}")
 
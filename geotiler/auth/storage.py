@@ -137,6 +137,33 @@ def _acquire_storage_token() -> tuple[Optional[str], Optional[datetime]]:
         raise
 
 
+# Account name is constant for the process; set it in env/GDAL config once
+_storage_account_configured = False
+
+
+def _configure_storage_account() -> None:
+    """
+    Set the storage account name for GDAL and obstore (once per process).
+
+    Only the token changes on refresh, so the account env vars and GDAL
+    config option are written on the first configure_storage_auth() call.
+    """
+    global _storage_account_configured
+    if _storage_account_configured:
+        return
+    _storage_account_configured = True
+
+    # GDAL (/vsiaz/) and obstore (abfs://) account names
+    os.environ["AZURE_STORAGE_ACCOUNT"] = settings.storage_account
+    os.environ["AZURE_STORAGE_ACCOUNT_NAME"] = settings.storage_account
+
+    try:
+        from rasterio import _env
+        _env.set_gdal_config("AZURE_STORAGE_ACCOUNT", settings.storage_account)
+    except Exception as e:
+        logger.warning(f"Could not set GDAL config directly: {e}")
+
+
 def configure_storage_auth(token: str) -> None:
     """
     Configure GDAL and obstore for Azure blob access using OAuth token.
@@ -145,6 +172,9 @@ def configure_storage_auth(token: str) -> None:
     - GDAL (COG tiles via /vsiaz/): AZURE_STORAGE_ACCOUNT + AZURE_STORAGE_ACCESS_TOKEN
     - obstore (Zarr tiles via abfs://): AZURE_STORAGE_ACCOUNT_NAME + AZURE_STORAGE_TOKEN
 
+    The account name is written once per process; subsequent calls (token
+    refresh) only update the token values.
+
     Args:
         token: OAuth bearer token for Azure Storage.
     """
@@ -152,18 +182,17 @@ def configure_storage_auth(token: str) -> None:
         logger.warning("GEOTILER_STORAGE_ACCOUNT not set, skipping storage auth config")
         return
 
-    # GDAL env vars — used by rasterio for /vsiaz/ COG access
-    os.environ["AZURE_STORAGE_ACCOUNT"] = settings.storage_account
+    _configure_storage_account()
+
+    # GDAL env var — used by rasterio for /vsiaz/ COG access
     os.environ["AZURE_STORAGE_ACCESS_TOKEN"] = token
 
-    # obstore env vars — used by titiler-xarray for abfs:// Zarr access
-    os.environ["AZURE_STORAGE_ACCOUNT_NAME"] = settings.storage_account
+    # obstore env var — used by titiler-xarray for abfs:// Zarr access
     os.environ["AZURE_STORAGE_TOKEN"] = token
 
     # Also set GDAL config options directly (more reliable than env vars)
     try:
         from rasterio import _env
-        _env.set_gdal_config("AZURE_STORAGE_ACCOUNT", settings.storage_account)
         _env.set_gdal_config("AZURE_STORAGE_ACCESS_TOKEN", token)
         logger.debug(f"Storage auth configured for account: {settings.storage_account}")
     except Exception as e:
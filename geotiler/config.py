@@ -11,6 +11,7 @@ Naming Convention:
 
     Boolean flags read as questions: GEOTILER_ENABLE_*
     Time values include units: *_SEC, *_MS
+    Unset optional strings default to "" (not None) — test with truthiness
 
 Key Configuration Notes:
     - Token TTL constants are tuned for Azure's 1-hour OAuth token lifetime
@@ -21,21 +22,48 @@ Observability (read via os.environ in infrastructure modules):
     - APPLICATIONINSIGHTS_CONNECTION_STRING: App Insights telemetry (third-party)
     - GEOTILER_ENABLE_OBSERVABILITY: Enable detailed request/latency logging
     - GEOTILER_OBS_SLOW_THRESHOLD_MS: Slow request threshold (default: 2000ms)
+    - GEOTILER_OBS_SAMPLE_RATE: Log 1 in N successful non-slow requests (default: 1)
     - GEOTILER_OBS_SERVICE_NAME: Service name for correlation (default: geotiler)
     - GEOTILER_OBS_ENVIRONMENT: Deployment environment (default: dev)
 
 UI Configuration:
     - GEOTILER_UI_SAMPLE_ZARR_URLS: JSON array of Zarr/NetCDF sample datasets for landing pages
+    - GEOTILER_UI_TEMPLATE_AUTO_RELOAD: Reload edited templates without restart (dev only)
+    - GEOTILER_UI_TEMPLATE_BYTECODE_DIR: Directory for compiled template bytecode (default: system temp)
 """
 
 import json
 import logging
 import os
-from typing import Literal, Optional, List
 from functools import lru_cache
+from typing import Literal, Optional, List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=16)
+def _parse_json_array_cached(json_str: str, var_name: str) -> tuple:
+    """
+    Safely parse a JSON array, returning an empty tuple on error.
+
+    Cached by (json_str, var_name) at module level so the parse survives
+    Settings reloads. Returns a tuple so the cached value can't be mutated
+    by callers; use ``_parse_json_array_cached.cache_clear()`` in tests.
+    """
+    if not json_str or json_str.strip() == "":
+        return ()
+    try:
+        result = json.loads(json_str)
+        if not isinstance(result, list):
+            logger.warning("%s must be a JSON array, got %s", var_name, type(result).__name__)
+            return ()
+        return tuple(result)
+    except json.JSONDecodeError as e:
+        logger.warning("Failed to parse %s as JSON: %s", var_name, e)
+        return ()
+
 
 class Settings(BaseSettings):
     """
@@ -67,7 +95,7 @@ class Settings(BaseSettings):
     enable_storage_auth: bool = False
     """Enable Azure OAuth for blob storage access (was USE_AZURE_AUTH)."""
 
-    storage_account: Optional[str] = None
+    storage_account: str = ""
     """Azure Storage account name for GDAL access."""
 
     auth_use_cli: bool = True
@@ -79,28 +107,28 @@ class Settings(BaseSettings):
     pg_auth_mode: Literal["password", "key_vault", "managed_identity"] = "password"
     """Authentication mode: 'password', 'key_vault', or 'managed_identity'."""
 
-    pg_host: Optional[str] = None
+    pg_host: str = ""
     """PostgreSQL server hostname."""
 
-    pg_db: Optional[str] = None
+    pg_db: str = ""
     """PostgreSQL database name."""
 
-    pg_user: Optional[str] = None
+    pg_user: str = ""
     """PostgreSQL username."""
 
     pg_port: int = 5432
     """PostgreSQL port."""
 
-    pg_password: Optional[str] = None
+    pg_password: str = ""
     """PostgreSQL password (for 'password' auth mode)."""
 
-    pg_mi_client_id: Optional[str] = None
+    pg_mi_client_id: str = ""
     """User-assigned Managed Identity client ID for PostgreSQL auth."""
 
     # =========================================================================
     # Key Vault — GEOTILER_KEYVAULT_*
     # =========================================================================
-    keyvault_name: Optional[str] = None
+    keyvault_name: str = ""
     """Azure Key Vault name (for 'key_vault' auth mode)."""
 
     keyvault_secret_name: str = "postgres-password"
@@ -221,24 +249,20 @@ class Settings(BaseSettings):
     ui_sample_zarr_urls: str = "[]"
     """JSON array of Zarr/NetCDF sample URLs for the /xarray/ landing page."""
 
+    ui_template_auto_reload: bool = False
+    """Re-stat template files on every render and reload on change.
+    Enable for local development; production templates are fixed per image."""
+
+    ui_template_bytecode_dir: str = ""
+    """Directory for the Jinja bytecode cache (empty = system temp dir).
+    Skipped with a warning if not writable, e.g. on a read-only filesystem."""
+
     @property
     def sample_zarr_urls(self) -> List[dict]:
         """Parse Zarr sample URLs from JSON environment variable."""
-        return self._parse_json_list(self.ui_sample_zarr_urls, "GEOTILER_UI_SAMPLE_ZARR_URLS")
-
-    def _parse_json_list(self, json_str: str, var_name: str) -> List[dict]:
-        """Safely parse a JSON array, returning empty list on error."""
-        if not json_str or json_str.strip() == "":
-            return []
-        try:
-            result = json.loads(json_str)
-            if not isinstance(result, list):
-                logging.warning(f"{var_name} must be a JSON array, got {type(result).__name__}")
-                return []
-            return result
-        except json.JSONDecodeError as e:
-            logging.warning(f"Failed to parse {var_name} as JSON: {e}")
-            return []
+        return list(
+            _parse_json_array_cached(self.ui_sample_zarr_urls, "GEOTILER_UI_SAMPLE_ZARR_URLS")
+        )
 
     # =========================================================================
     # Downloads — GEOTILER_ENABLE_DOWNLOADS, GEOTILER_DOWNLOAD_*
@@ -303,7 +327,7 @@ class Settings(BaseSettings):
     @property
     def has_postgres_config(self) -> bool:
         """Check if minimum PostgreSQL configuration is present."""
-        return all([self.pg_host, self.pg_db, self.pg_user])
+        return bool(self.pg_host and self.pg_db and self.pg_user)
 
 
 # =============================================================================
@@ -320,6 +344,19 @@ READYZ_MIN_TTL_SECS: int = 60
 BACKGROUND_REFRESH_INTERVAL_SECS: int = 45 * 60
 """Background token refresh interval (45 minutes)."""
 
+# Health reporting
+HARDWARE_INFO_TTL_SECS: float = 5.0
+"""Reuse psutil hardware snapshot for this long (shared across pollers)."""
+
+ADMIN_HEALTH_TTL_SECS: float = 5.0
+"""Reuse admin console health data for this long (shared across open tabs)."""
+
+DIAGNOSTICS_CACHE_TTL_SECS: float = 30.0
+"""Reuse the /vector/diagnostics report for this long (?nocache=true bypasses)."""
+
+CATALOG_CACHE_TTL_SECS: float = 60.0
+"""Reuse stable catalog lookups (server/PostGIS version, geometry types) this long."""
+
 # Tile rendering
 TILE_SIZE: int = 256
 """Standard web map tile size in pixels."""
@@ -331,14 +368,28 @@ STORAGE_SCOPE: str = "https://storage.azure.com/.default"
 POSTGRES_SCOPE: str = "https://ossrdbms-aad.database.windows.net/.default"
 """OAuth scope for Azure Database for PostgreSQL."""
 
-@lru_cache
+_settings_instance: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
     """
-    Get cached Settings instance.
+    Get the process-wide Settings instance.
 
-    Uses lru_cache to ensure settings are only loaded once.
+    Settings are loaded once on first call and returned directly afterwards
+    (a single ``is None`` check instead of lru_cache dispatch).
     """
-    return Settings()
+    global _settings_instance
+
+    if _settings_instance is None:
+        _settings_instance = Settings()
+
+    return _settings_instance
+
+
+def _reset_settings_for_test() -> None:
+    """Clear the cached Settings instance so the next get_settings() reloads env."""
+    global _settings_instance
+    _settings_instance = None
 
 
 # Convenience alias for direct import
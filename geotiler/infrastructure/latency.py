@@ -13,7 +13,8 @@ to diagnose slow requests and identify whether delays are from network I/O
 
 Key Design:
 -----------
-- Zero overhead when GEOTILER_ENABLE_OBSERVABILITY=false (early return, no timing)
+- Zero overhead when GEOTILER_ENABLE_OBSERVABILITY=false (decorators return the
+  original function; no wrapper, no timing)
 - Full timing + structured logging when enabled
 - Slow operation alerting (configurable threshold)
 - Designed for Application Insights Kusto queries
@@ -22,6 +23,7 @@ Environment Variables:
 ----------------------
 GEOTILER_ENABLE_OBSERVABILITY: Enable latency tracking (default: false)
 GEOTILER_OBS_SLOW_THRESHOLD_MS: Threshold for slow warnings (default: 2000)
+GEOTILER_OBS_SAMPLE_RATE: Log 1 in N successful non-slow operations (default: 1)
 
 Usage:
 ------
@@ -65,10 +67,11 @@ Exports:
     SLOW_THRESHOLD_MS: Current slow threshold value
 """
 
+import itertools
 import logging
 import os
+import sys
 import time
-from contextlib import contextmanager
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
 
@@ -76,20 +79,111 @@ logger = logging.getLogger(__name__)
 
 # Slow operation threshold (milliseconds) - configurable via env var
 SLOW_THRESHOLD_MS = int(os.environ.get("GEOTILER_OBS_SLOW_THRESHOLD_MS", "2000"))
+_SLOW_NS = SLOW_THRESHOLD_MS * 1_000_000
+
+# Sampling: emit 1 in N successful non-slow records (slow/error always emitted)
+SAMPLE_RATE = max(1, int(os.environ.get("GEOTILER_OBS_SAMPLE_RATE", "1")))
+_sample_counter = itertools.count()
+
+# Kwargs safe to log with include_args=True (small, non-sensitive values)
+_SAFE_ARG_KEYS = frozenset(("z", "x", "y", "collection_id", "search_id", "format"))
+
+
+def _read_observability_flag() -> bool:
+    """Read GEOTILER_ENABLE_OBSERVABILITY from the environment."""
+    val = os.environ.get("GEOTILER_ENABLE_OBSERVABILITY", "").lower()
+    return val in ("true", "1", "yes")
+
+
+# Observability flag - read once at import (env is fixed for the process)
+_OBS_ENABLED = _read_observability_flag()
 
 
 def _is_observability_enabled() -> bool:
     """
     Check if observability mode is enabled.
 
-    Checks GEOTILER_ENABLE_OBSERVABILITY env var. When false, all latency tracking
-    has zero overhead (early return before any timing).
+    Returns the GEOTILER_ENABLE_OBSERVABILITY value cached at import. When
+    false, all latency tracking has zero overhead (early return before any
+    timing).
 
     Returns:
         bool: True if observability features should be active
     """
-    val = os.environ.get("GEOTILER_ENABLE_OBSERVABILITY", "").lower()
-    return val in ("true", "1", "yes")
+    return _OBS_ENABLED
+
+
+def reload_config() -> None:
+    """
+    Re-read observability env vars (for tests that change them at runtime).
+    """
+    global _OBS_ENABLED, SLOW_THRESHOLD_MS, _SLOW_NS, SAMPLE_RATE
+    _OBS_ENABLED = _read_observability_flag()
+    SLOW_THRESHOLD_MS = int(os.environ.get("GEOTILER_OBS_SLOW_THRESHOLD_MS", "2000"))
+    _SLOW_NS = SLOW_THRESHOLD_MS * 1_000_000
+    SAMPLE_RATE = max(1, int(os.environ.get("GEOTILER_OBS_SAMPLE_RATE", "1")))
+
+
+def _emit_latency(
+    operation_name: str,
+    elapsed_ns: int,
+    error: Optional[BaseException],
+    kwargs: Optional[Dict[str, Any]],
+) -> None:
+    """
+    Emit the [TILE_LATENCY] record for track_latency / track_latency_async.
+
+    Args:
+        operation_name: Identifier passed to the decorator
+        elapsed_ns: Measured execution time (perf_counter_ns delta)
+        error: Exception raised by the call, or None on success. Stringified
+            only once the record is known to be emitted.
+        kwargs: Call kwargs when include_args=True, else None
+    """
+    is_slow = elapsed_ns > _SLOW_NS
+
+    if not is_slow and error is None:
+        # Skip dict/f-string work when the record would be dropped anyway
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        # Sampled out (GEOTILER_OBS_SAMPLE_RATE)
+        if SAMPLE_RATE > 1 and next(_sample_counter) % SAMPLE_RATE:
+            return
+
+    duration_ms = elapsed_ns / 1e6
+
+    # Build custom dimensions
+    custom_dims = {
+        "operation": operation_name,
+        "duration_ms": duration_ms,
+        "status": "success" if error is None else "error",
+        "slow": is_slow,
+    }
+
+    # Optionally include args (useful for debugging but can be verbose)
+    if kwargs:
+        # Filter out potentially large/sensitive values
+        custom_dims["args"] = {
+            k: v for k, v in kwargs.items() if k in _SAFE_ARG_KEYS
+        }
+
+    if error is not None:
+        error_msg = str(error)
+        if error_msg:
+            custom_dims["error"] = error_msg[:200]
+
+    extra = {"custom_dimensions": custom_dims}
+
+    if is_slow:
+        logger.warning(
+            f"[TILE_LATENCY] SLOW {operation_name}: {duration_ms:.0f}ms",
+            extra=extra
+        )
+    else:
+        logger.info(
+            f"[TILE_LATENCY] {operation_name}: {duration_ms:.0f}ms",
+            extra=extra
+        )
 
 
 def track_latency(operation_name: str, include_args: bool = False):
@@ -97,7 +191,9 @@ def track_latency(operation_name: str, include_args: bool = False):
     Decorator to track latency for tile rendering and service operations.
 
     Zero overhead when GEOTILER_ENABLE_OBSERVABILITY=false - the original function
-    is called directly without any timing or logging.
+    is returned undecorated (no wrapper frame, no timing or logging). The flag
+    is evaluated at decoration time, so reload_config() only affects functions
+    decorated afterwards.
 
     When enabled, logs structured JSON with:
     - operation: Operation name for filtering
@@ -105,6 +201,9 @@ def track_latency(operation_name: str, include_args: bool = False):
     - status: 'success' or 'error'
     - slow: True if duration > GEOTILER_OBS_SLOW_THRESHOLD_MS
 
+    Successful non-slow operations are sampled at 1 in GEOTILER_OBS_SAMPLE_RATE;
+    slow and failed operations are always logged.
+
     Args:
         operation_name: Identifier for this operation (e.g., 'cog.render_tile')
         include_args: If True, include function arguments in log (be careful with URLs)
@@ -121,61 +220,34 @@ def track_latency(operation_name: str, include_args: bool = False):
         def search(collection_id: str, bbox=None):
             ...
     """
+    # Fixed per decoration; interned so dict/key comparisons hit the identity check
+    operation_name = sys.intern(operation_name)
+
     def decorator(func: Callable) -> Callable:
+        # Fast path: no wrapper at all when disabled
+        if not _OBS_ENABLED:
+            return func
+
+        # Bind per-call lookups once (closure reads instead of global + attr)
+        _now = time.perf_counter_ns
+        _emit = _emit_latency
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            # Fast path: no overhead when disabled
-            if not _is_observability_enabled():
-                return func(*args, **kwargs)
-
-            # Slow path: full timing when enabled
-            start = time.perf_counter()
-            status = "success"
-            error_msg = None
+            start = _now()
+            error = None
 
             try:
                 result = func(*args, **kwargs)
                 return result
             except Exception as e:
-                status = "error"
-                error_msg = str(e)
+                error = e
                 raise
             finally:
-                duration_ms = (time.perf_counter() - start) * 1000
-                is_slow = duration_ms > SLOW_THRESHOLD_MS
-
-                # Build custom dimensions
-                custom_dims = {
-                    "operation": operation_name,
-                    "duration_ms": round(duration_ms, 2),
-                    "status": status,
-                    "slow": is_slow,
-                }
-
-                # Optionally include args (useful for debugging but can be verbose)
-                if include_args and kwargs:
-                    # Filter out potentially large/sensitive values
-                    safe_kwargs = {
-                        k: v for k, v in kwargs.items()
-                        if k in ("z", "x", "y", "collection_id", "search_id", "format")
-                    }
-                    custom_dims["args"] = safe_kwargs
-
-                if error_msg:
-                    custom_dims["error"] = error_msg[:200]
-
-                extra = {"custom_dimensions": custom_dims}
-
-                if is_slow:
-                    logger.warning(
-                        f"[TILE_LATENCY] SLOW {operation_name}: {duration_ms:.0f}ms",
-                        extra=extra
-                    )
-                else:
-                    logger.info(
-                        f"[TILE_LATENCY] {operation_name}: {duration_ms:.0f}ms",
-                        extra=extra
-                    )
+                _emit(
+                    operation_name, _now() - start,
+                    error, kwargs if include_args else None,
+                )
 
         return wrapper
     return decorator
@@ -192,78 +264,87 @@ def track_latency_async(operation_name: str, include_args: bool = False):
         async def search_items(collection_id: str):
             ...
     """
+    # Fixed per decoration; interned so dict/key comparisons hit the identity check
+    operation_name = sys.intern(operation_name)
+
     def decorator(func: Callable) -> Callable:
+        # Fast path: no wrapper at all when disabled
+        if not _OBS_ENABLED:
+            return func
+
+        # Bind per-call lookups once (closure reads instead of global + attr)
+        _now = time.perf_counter_ns
+        _emit = _emit_latency
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            # Fast path: no overhead when disabled
-            if not _is_observability_enabled():
-                return await func(*args, **kwargs)
-
-            # Slow path: full timing when enabled
-            start = time.perf_counter()
-            status = "success"
-            error_msg = None
+            start = _now()
+            error = None
 
             try:
                 result = await func(*args, **kwargs)
                 return result
             except Exception as e:
-                status = "error"
-                error_msg = str(e)
+                error = e
                 raise
             finally:
-                duration_ms = (time.perf_counter() - start) * 1000
-                is_slow = duration_ms > SLOW_THRESHOLD_MS
-
-                custom_dims = {
-                    "operation": operation_name,
-                    "duration_ms": round(duration_ms, 2),
-                    "status": status,
-                    "slow": is_slow,
-                }
-
-                if include_args and kwargs:
-                    safe_kwargs = {
-                        k: v for k, v in kwargs.items()
-                        if k in ("z", "x", "y", "collection_id", "search_id", "format")
-                    }
-                    custom_dims["args"] = safe_kwargs
-
-                if error_msg:
-                    custom_dims["error"] = error_msg[:200]
-
-                extra = {"custom_dimensions": custom_dims}
-
-                if is_slow:
-                    logger.warning(
-                        f"[TILE_LATENCY] SLOW {operation_name}: {duration_ms:.0f}ms",
-                        extra=extra
-                    )
-                else:
-                    logger.info(
-                        f"[TILE_LATENCY] {operation_name}: {duration_ms:.0f}ms",
-                        extra=extra
-                    )
+                _emit(
+                    operation_name, _now() - start,
+                    error, kwargs if include_args else None,
+                )
 
         return wrapper
     return decorator
 
 
-@contextmanager
-def timed_section(section_name: str, context: Optional[Dict[str, Any]] = None):
+def _emit_section(
+    section_name: str,
+    duration_ms: float,
+    is_slow: bool,
+    context: Optional[Dict[str, Any]],
+) -> None:
+    """Emit the [SECTION_LATENCY] record for timed_section."""
+    custom_dims = {
+        "section": section_name,
+        "duration_ms": duration_ms,
+        "slow": is_slow,
+    }
+
+    if context:
+        # Merge context but don't overwrite core fields
+        for k, v in context.items():
+            if k not in custom_dims:
+                custom_dims[k] = v
+
+    extra = {"custom_dimensions": custom_dims}
+
+    if is_slow:
+        logger.warning(
+            f"[SECTION_LATENCY] SLOW {section_name}: {duration_ms:.0f}ms",
+            extra=extra
+        )
+    else:
+        logger.debug(
+            f"[SECTION_LATENCY] {section_name}: {duration_ms:.0f}ms",
+            extra=extra
+        )
+
+
+class timed_section:
     """
     Context manager for timing arbitrary code sections.
 
     Useful for breaking down a large operation into sub-timings to identify
     which specific part is slow (e.g., network fetch vs CPU rendering).
 
+    Implemented as a slotted class rather than @contextmanager so each use
+    costs one small object allocation (no generator), and the disabled path
+    is a single flag check in __enter__/__exit__.
+
     Args:
         section_name: Identifier for this section
         context: Optional dict of additional context to log
 
-    Yields:
-        None - use as context manager
-
     Example:
         # Break down tile rendering into phases:
         with timed_section("fetch_cog_overview", {"url": url, "z": z}):
@@ -275,41 +356,28 @@ def timed_section(section_name: str, context: Optional[Dict[str, Any]] = None):
         with timed_section("encode_png"):
             result = encode(tile_data, "png")
     """
-    if not _is_observability_enabled():
-        yield
-        return
-
-    start = time.perf_counter()
-    try:
-        yield
-    finally:
-        duration_ms = (time.perf_counter() - start) * 1000
-        is_slow = duration_ms > SLOW_THRESHOLD_MS
-
-        custom_dims = {
-            "section": section_name,
-            "duration_ms": round(duration_ms, 2),
-            "slow": is_slow,
-        }
 
-        if context:
-            # Merge context but don't overwrite core fields
-            for k, v in context.items():
-                if k not in custom_dims:
-                    custom_dims[k] = v
+    __slots__ = ("section_name", "context", "_start")
+
+    def __init__(self, section_name: str, context: Optional[Dict[str, Any]] = None):
+        self.section_name = section_name
+        self.context = context
+        self._start = 0
+
+    def __enter__(self) -> None:
+        if _OBS_ENABLED:
+            self._start = time.perf_counter_ns()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not _OBS_ENABLED:
+            return
 
-        extra = {"custom_dimensions": custom_dims}
+        elapsed_ns = time.perf_counter_ns() - self._start
+        is_slow = elapsed_ns > _SLOW_NS
 
-        if is_slow:
-            logger.warning(
-                f"[SECTION_LATENCY] SLOW {section_name}: {duration_ms:.0f}ms",
-                extra=extra
-            )
-        else:
-            logger.debug(
-                f"[SECTION_LATENCY] {section_name}: {duration_ms:.0f}ms",
-                extra=extra
-            )
+        # Skip dict/f-string work when the record would be dropped anyway
+        if is_slow or logger.isEnabledFor(logging.DEBUG):
+            _emit_section(self.section_name, elapsed_ns / 1e6, is_slow, self.context)
 
 
 # Export
@@ -318,4 +386,6 @@ __all__ = [
     "track_latency_async",
     "timed_section",
     "SLOW_THRESHOLD_MS",
+    "SAMPLE_RATE",
+    "reload_config",
 ]
@@ -12,6 +12,8 @@ enabling powerful Kusto queries for performance analysis.
 
 Design Principles:
     - Component-based loggers (COG, Xarray, pgSTAC, Auth, Health)
+    - Non-blocking emit: records are queued and written to stdout by a
+      background QueueListener thread, off the request path
     - Global context injection (app_name, environment, instance)
     - custom_dimensions support for Application Insights
     - Zero dependencies beyond stdlib + optional psutil
@@ -31,11 +33,15 @@ Exports:
     get_global_log_context: Get global context fields
 """
 
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
 import sys
-from datetime import datetime, timezone
+import time
+from logging.handlers import QueueHandler, QueueListener
 from enum import Enum
 from typing import Any, Dict, Optional
 
@@ -57,6 +63,12 @@ class ComponentType(Enum):
     APP = "app"              # Application lifecycle
 
 
+# Logger name -> component value, registered by LoggerFactory.create_logger().
+# Exact-name lookup, so only those loggers are tagged (not their children or
+# other geotiler.* loggers), same as the per-logger filter this replaces.
+_LOGGER_COMPONENTS: Dict[str, str] = {}
+
+
 # ============================================================================
 # GLOBAL LOG CONTEXT
 # ============================================================================
@@ -92,10 +104,44 @@ def get_global_log_context() -> Dict[str, str]:
     return _GLOBAL_LOG_CONTEXT
 
 
+_GLOBAL_LOG_CONTEXT_JSON: Optional[str] = None
+
+
+def _get_global_log_context_json() -> str:
+    """
+    Get the global log context pre-serialized as JSON object members.
+
+    Returns a fragment like ``, "app_name": "geotiler", ...`` that JSONFormatter
+    splices before the closing brace, so the constant fields are encoded once
+    per process instead of once per record.
+    """
+    global _GLOBAL_LOG_CONTEXT_JSON
+
+    if _GLOBAL_LOG_CONTEXT_JSON is None:
+        _GLOBAL_LOG_CONTEXT_JSON = "".join(
+            f", {json.dumps(k)}: {json.dumps(v)}"
+            for k, v in get_global_log_context().items()
+        )
+
+    return _GLOBAL_LOG_CONTEXT_JSON
+
+
 # ============================================================================
 # JSON FORMATTER
 # ============================================================================
 
+def _fast_isoformat(ts: float) -> str:
+    """
+    Format an epoch timestamp as UTC ISO-8601.
+
+    Same output as ``datetime.fromtimestamp(ts, timezone.utc).isoformat()``
+    without allocating datetime objects.
+    """
+    secs = int(ts)
+    micros = int((ts - secs) * 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))}.{micros:06d}+00:00"
+
+
 class JSONFormatter(logging.Formatter):
     """
     JSON formatter for structured logging to Application Insights.
@@ -113,28 +159,66 @@ class JSONFormatter(logging.Formatter):
         """Format log record as JSON."""
         # Base log entry
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _fast_isoformat(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # Add global context
-        log_entry.update(get_global_log_context())
+        # extra={...} fields live in the record's instance dict; one local
+        # dict lookup each instead of hasattr() attribute resolution
+        record_attrs = record.__dict__
 
-        # Add component if present
-        if hasattr(record, "component"):
-            log_entry["component"] = record.component
+        # Add component: explicit extra wins, else the component registered
+        # for this logger by create_logger()
+        component = record_attrs.get("component")
+        if component is None:
+            component = _LOGGER_COMPONENTS.get(record.name)
+        if component is not None:
+            log_entry["component"] = component
 
         # Add custom dimensions if present
-        if hasattr(record, "custom_dimensions"):
-            log_entry["custom_dimensions"] = record.custom_dimensions
+        custom_dimensions = record_attrs.get("custom_dimensions")
+        if custom_dimensions is not None:
+            log_entry["custom_dimensions"] = custom_dimensions
 
         # Add exception info if present
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry)
+        # Splice in pre-serialized global context before the closing brace
+        return json.dumps(log_entry)[:-1] + _get_global_log_context_json() + "}"
+
+
+# ============================================================================
+# QUEUE HANDLER
+# ============================================================================
+
+LOG_QUEUE_MAXSIZE: int = 10_000
+"""Maximum queued log records before new records are dropped."""
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process listener thread.
+
+    The stock prepare() formats the record and strips exc_info so it can be
+    pickled; here the queue never leaves the process, so only the message
+    args are resolved (the caller may mutate them) and exc_info is kept for
+    JSONFormatter's separate "exception" field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass  # Drop rather than block the request path
 
 
 # ============================================================================
@@ -170,6 +254,7 @@ class LoggerFactory:
 
     _configured: bool = False
     _use_json: bool = True
+    _listener: Optional[QueueListener] = None
 
     @classmethod
     def configure(cls, use_json: bool = True, level: int = logging.INFO) -> None:
@@ -193,18 +278,27 @@ class LoggerFactory:
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
 
-        # Add stdout handler with appropriate formatter
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(level)
+        # stdout handler with appropriate formatter — driven by the listener
+        # thread, so JSON encoding and the write happen off the request path
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setLevel(level)
 
         if use_json:
-            handler.setFormatter(JSONFormatter())
+            stream_handler.setFormatter(JSONFormatter())
         else:
-            handler.setFormatter(logging.Formatter(
+            stream_handler.setFormatter(logging.Formatter(
                 "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S"
             ))
 
+        log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+        cls._listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        cls._listener.start()
+        atexit.register(cls._listener.stop)  # Flush queued records on exit
+
+        handler = _InProcessQueueHandler(log_queue)
+        handler.setLevel(level)
+
         root_logger.addHandler(handler)
 
         # Configure uvicorn loggers to use same handler
@@ -249,33 +343,45 @@ class LoggerFactory:
         if level is not None:
             logger.setLevel(level)
 
-        # Add component attribute via filter (scoped to this logger only)
-        logger.addFilter(_ComponentFilter(component.value))
-
+        # Component is looked up by logger name in JSONFormatter
+        _LOGGER_COMPONENTS[logger.name] = component.value
         return logger
 
 
-class _ComponentFilter(logging.Filter):
-    """Injects a component attribute into log records for App Insights filtering."""
+# ============================================================================
+# MEMORY STATS (Optional - requires psutil)
+# ============================================================================
+
+try:
+    import psutil
+except ImportError:  # psutil is optional
+    psutil = None
+
+# Cached process handle (psutil.Process keeps cpu_percent() state between calls)
+_PROCESS: Optional["psutil.Process"] = None
 
-    def __init__(self, component_value: str):
-        super().__init__()
-        self._component = component_value
+CPU_PERCENT_REFRESH_SECS: float = 5.0
+"""Minimum interval between process cpu_percent() reads."""
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        record.component = self._component
-        return True
+_cpu_percent_cache: tuple[float, float] = (0.0, 0.0)  # (monotonic ts, value)
 
 
-# ============================================================================
-# MEMORY STATS (Optional - requires psutil)
-# ============================================================================
+def _get_process() -> "psutil.Process":
+    """Return the cached psutil.Process for this PID (re-created after fork)."""
+    global _PROCESS
+    pid = os.getpid()
+    if _PROCESS is None or _PROCESS.pid != pid:
+        _PROCESS = psutil.Process(pid)
+    return _PROCESS
+
 
 def get_memory_stats() -> Optional[Dict[str, float]]:
     """
     Get current process memory and CPU statistics.
 
-    Useful for tracking resource usage during tile rendering.
+    Useful for tracking resource usage during tile rendering. The process
+    handle is cached at module level, and process CPU% is re-sampled at most
+    every CPU_PERCENT_REFRESH_SECS.
 
     Returns:
         dict with resource stats or None if psutil unavailable:
@@ -287,21 +393,28 @@ def get_memory_stats() -> Optional[Dict[str, float]]:
             'system_percent': float,      # System memory usage %
         }
     """
-    try:
-        import psutil
+    global _cpu_percent_cache
+
+    if psutil is None:
+        return None
 
-        process = psutil.Process(os.getpid())
+    try:
+        process = _get_process()
         mem_info = process.memory_info()
         system_mem = psutil.virtual_memory()
 
+        now = time.monotonic()
+        cpu_ts, cpu_percent = _cpu_percent_cache
+        if now - cpu_ts >= CPU_PERCENT_REFRESH_SECS:
+            cpu_percent = process.cpu_percent(interval=None)
+            _cpu_percent_cache = (now, cpu_percent)
+
         return {
             "process_rss_mb": round(mem_info.rss / 1024 / 1024, 2),
             "process_vms_mb": round(mem_info.vms / 1024 / 1024, 2),
-            "process_cpu_percent": round(process.cpu_percent(interval=None), 1),
+            "process_cpu_percent": round(cpu_percent, 1),
             "system_available_mb": round(system_mem.available / 1024 / 1024, 2),
             "system_percent": round(system_mem.percent, 1),
         }
-    except ImportError:
-        return None
     except Exception:
         return None
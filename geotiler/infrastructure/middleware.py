@@ -21,6 +21,7 @@ Environment Variables:
 ----------------------
 GEOTILER_ENABLE_OBSERVABILITY: Enable request timing (default: false)
 GEOTILER_OBS_SLOW_THRESHOLD_MS: Threshold for slow warnings (default: 2000)
+GEOTILER_OBS_SAMPLE_RATE: Log 1 in N successful non-slow requests (default: 1)
 
 Application Insights Queries:
 -----------------------------
@@ -63,6 +64,7 @@ traces
 ```
 """
 
+import itertools
 import logging
 import os
 import re
@@ -75,58 +77,141 @@ logger = logging.getLogger(__name__)
 
 # Slow threshold from env var
 SLOW_THRESHOLD_MS = int(os.environ.get("GEOTILER_OBS_SLOW_THRESHOLD_MS", "2000"))
+_SLOW_NS = SLOW_THRESHOLD_MS * 1_000_000
 
-# Regex to extract tile coordinates from paths like /cog/tiles/10/512/384.png
-TILE_PATH_PATTERN = re.compile(
-    r"/(cog|xarray|searches/[^/]+|vector|pc)/.*?/(\d+)/(\d+)/(\d+)"
+# Sampling: emit 1 in N successful non-slow requests (slow/4xx/5xx always emitted)
+SAMPLE_RATE = max(1, int(os.environ.get("GEOTILER_OBS_SAMPLE_RATE", "1")))
+_sample_counter = itertools.count()
+
+# Only these prefixes can carry tile coordinates or search IDs
+_TILE_PREFIXES = ("/cog/", "/xarray/", "/pc/", "/vector/", "/searches/")
+
+# Tile paths like /cog/tiles/10/512/384.png or /searches/{id}/tiles/8/128/64@2x.png.
+# One match yields both the normalized endpoint prefix and the z/x/y coordinates.
+_TILE_RE = re.compile(
+    r"^(?P<prefix>/(?:cog|xarray|pc|vector|searches/(?P<search_id>[^/]+))/.*?)"
+    r"/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)(?:@\d+x)?(?:\.\w+)?$"
 )
 
+# Search IDs in non-tile paths (e.g. /searches/{id}/info)
+_SEARCH_ID_RE = re.compile(r"^/searches/[a-f0-9-]+/")
 
-def _is_observability_enabled() -> bool:
-    """Check if observability mode is enabled."""
+# Paths never timed (health probes and browser noise)
+_SKIP_PATHS = frozenset({"/livez", "/readyz", "/health", "/metrics", "/favicon.ico"})
+
+
+def _read_observability_flag() -> bool:
+    """Read GEOTILER_ENABLE_OBSERVABILITY from the environment."""
     val = os.environ.get("GEOTILER_ENABLE_OBSERVABILITY", "").lower()
     return val in ("true", "1", "yes")
 
 
-def _normalize_endpoint(path: str) -> str:
-    """
-    Normalize endpoint path for aggregation.
+# Observability flag - read once at import (env is fixed for the process)
+_OBS_ENABLED = _read_observability_flag()
 
-    Replaces tile coordinates and UUIDs with placeholders so metrics
-    can be aggregated by endpoint pattern rather than individual tiles.
 
-    Examples:
-        /cog/tiles/10/512/384.png -> /cog/tiles/{z}/{x}/{y}
-        /searches/abc123-def456/tiles/8/128/64 -> /searches/{search_id}/tiles/{z}/{x}/{y}
-    """
-    # Replace tile coordinates
-    path = re.sub(r"/(\d+)/(\d+)/(\d+)(\.\w+)?$", r"/{z}/{x}/{y}", path)
-
-    # Replace UUIDs in searches path
-    path = re.sub(
-        r"/searches/[a-f0-9-]+/",
-        "/searches/{search_id}/",
-        path
-    )
+def _is_observability_enabled() -> bool:
+    """Check if observability mode is enabled (cached at import)."""
+    return _OBS_ENABLED
+
 
-    return path
+def reload_config() -> None:
+    """Re-read observability env vars (for tests that change them at runtime)."""
+    global _OBS_ENABLED, SLOW_THRESHOLD_MS, _SLOW_NS, SAMPLE_RATE
+    _OBS_ENABLED = _read_observability_flag()
+    SLOW_THRESHOLD_MS = int(os.environ.get("GEOTILER_OBS_SLOW_THRESHOLD_MS", "2000"))
+    _SLOW_NS = SLOW_THRESHOLD_MS * 1_000_000
+    SAMPLE_RATE = max(1, int(os.environ.get("GEOTILER_OBS_SAMPLE_RATE", "1")))
 
 
-def _extract_tile_info(path: str) -> dict:
+def _parse_path(path: str) -> tuple[str, dict]:
     """
-    Extract tile coordinates from path if present.
+    Normalize endpoint path and extract tile coordinates in a single pass.
+
+    Replaces tile coordinates and search IDs with placeholders so metrics
+    can be aggregated by endpoint pattern rather than individual tiles.
+
+    Examples:
+        /cog/tiles/10/512/384.png -> (/cog/tiles/{z}/{x}/{y}, {z: 10, x: 512, y: 384})
+        /searches/abc123-def456/tiles/8/128/64 -> (/searches/{search_id}/tiles/{z}/{x}/{y}, {...})
+        /searches/abc123-def456/info -> (/searches/{search_id}/info, {})
 
     Returns:
-        dict with z, x, y if path contains tile coordinates, empty dict otherwise
+        Tuple of (normalized endpoint, dict with z/x/y or empty dict)
+    """
+    # Cheap reject for non-tile endpoints (/api, /docs, /stac, ...)
+    if not path.startswith(_TILE_PREFIXES):
+        return path, {}
+
+    match = _TILE_RE.match(path)
+    if match is None:
+        return _SEARCH_ID_RE.sub("/searches/{search_id}/", path, count=1), {}
+
+    if match.group("search_id") is not None:
+        prefix = (
+            path[:match.start("search_id")]
+            + "{search_id}"
+            + path[match.end("search_id"):match.end("prefix")]
+        )
+    else:
+        prefix = match.group("prefix")
+
+    tile_info = {
+        "z": int(match.group("z")),
+        "x": int(match.group("x")),
+        "y": int(match.group("y")),
+    }
+    return f"{prefix}/{{z}}/{{x}}/{{y}}", tile_info
+
+
+def _emit_request_log(
+    level: int,
+    scope: Scope,
+    path: str,
+    method: str,
+    duration_ms: float,
+    status_code: int,
+    response_bytes: int,
+    is_slow: bool,
+) -> None:
     """
-    match = TILE_PATH_PATTERN.search(path)
-    if match:
-        return {
-            "z": int(match.group(2)),
-            "x": int(match.group(3)),
-            "y": int(match.group(4)),
-        }
-    return {}
+    Build custom dimensions and emit the [REQUEST] record.
+
+    Only called once the logger is known to accept ``level``, so path
+    normalization and query-string parsing are skipped for dropped records.
+    """
+    endpoint, tile_info = _parse_path(path)
+    custom_dims = {
+        "endpoint": endpoint,
+        "method": method,
+        "duration_ms": duration_ms,
+        "status_code": status_code,
+        "response_bytes": response_bytes,
+        "slow": is_slow,
+    }
+
+    if tile_info:
+        custom_dims.update(tile_info)
+
+    query_string = scope.get("query_string", b"")
+    if query_string:
+        query_params = parse_qs(query_string.decode("latin-1"))
+
+        url_values = query_params.get("url")
+        if url_values:
+            url = url_values[0]
+            custom_dims["source_url"] = url[:200] if len(url) > 200 else url
+
+        format_values = query_params.get("format")
+        if format_values:
+            custom_dims["format"] = format_values[0]
+
+    slow_tag = "SLOW " if is_slow and status_code < 500 else ""
+    logger.log(
+        level,
+        f"[REQUEST] {slow_tag}{method} {endpoint} -> {status_code} ({duration_ms:.0f}ms)",
+        extra={"custom_dimensions": custom_dims},
+    )
 
 
 class RequestTimingMiddleware:
@@ -142,6 +227,7 @@ class RequestTimingMiddleware:
     - slow: True if duration > threshold
 
     Logs are tagged with [REQUEST] prefix for easy filtering in App Insights.
+    Successful non-slow requests are sampled at 1 in GEOTILER_OBS_SAMPLE_RATE.
     """
 
     def __init__(self, app: ASGIApp) -> None:
@@ -153,22 +239,20 @@ class RequestTimingMiddleware:
             return
 
         # Fast path: skip timing if observability disabled
-        if not _is_observability_enabled():
+        if not _OBS_ENABLED:
             await self.app(scope, receive, send)
             return
 
         path: str = scope.get("path", "")
 
-        # Skip timing for health probes (too noisy)
-        if path in ("/livez", "/readyz", "/health"):
+        # Skip timing for health probes (too noisy) — before any clock read
+        if path in _SKIP_PATHS:
             await self.app(scope, receive, send)
             return
 
         method = scope.get("method", "?")
-        query_string = scope.get("query_string", b"").decode("latin-1")
-        query_params = parse_qs(query_string)
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         status_code = 500
         response_bytes = 0
 
@@ -179,7 +263,9 @@ class RequestTimingMiddleware:
                 status_code = message.get("status", 500)
                 for name, value in message.get("headers", []):
                     if name == b"content-length":
-                        response_bytes = int(value)
+                        # isdigit() guard: malformed values stay 0 instead of raising
+                        if value.isdigit():
+                            response_bytes = int(value)
                         break
 
             await send(message)
@@ -187,58 +273,31 @@ class RequestTimingMiddleware:
         try:
             await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.exception(f"Request failed: {e}")
+            logger.exception("Request failed: %s", e)
             raise
         finally:
-            duration_ms = (time.perf_counter() - start) * 1000
-            is_slow = duration_ms > SLOW_THRESHOLD_MS
-
-            endpoint = _normalize_endpoint(path)
-            custom_dims = {
-                "endpoint": endpoint,
-                "method": method,
-                "duration_ms": round(duration_ms, 2),
-                "status_code": status_code,
-                "response_bytes": response_bytes,
-                "slow": is_slow,
-            }
-
-            tile_info = _extract_tile_info(path)
-            if tile_info:
-                custom_dims.update(tile_info)
-
-            url_values = query_params.get("url")
-            if url_values:
-                url = url_values[0]
-                custom_dims["source_url"] = url[:200] if len(url) > 200 else url
-
-            format_values = query_params.get("format")
-            if format_values:
-                custom_dims["format"] = format_values[0]
-
-            extra = {"custom_dimensions": custom_dims}
+            elapsed_ns = time.perf_counter_ns() - start
+            is_slow = elapsed_ns > _SLOW_NS
 
             if status_code >= 500:
-                logger.error(
-                    f"[REQUEST] {method} {endpoint} -> {status_code} ({duration_ms:.0f}ms)",
-                    extra=extra
-                )
-            elif is_slow:
-                logger.warning(
-                    f"[REQUEST] SLOW {method} {endpoint} -> {status_code} ({duration_ms:.0f}ms)",
-                    extra=extra
-                )
-            elif status_code >= 400:
-                logger.warning(
-                    f"[REQUEST] {method} {endpoint} -> {status_code} ({duration_ms:.0f}ms)",
-                    extra=extra
-                )
+                level = logging.ERROR
+            elif is_slow or status_code >= 400:
+                level = logging.WARNING
             else:
-                logger.info(
-                    f"[REQUEST] {method} {endpoint} -> {status_code} ({duration_ms:.0f}ms)",
-                    extra=extra
+                level = logging.INFO
+
+            sampled_out = (
+                level == logging.INFO
+                and SAMPLE_RATE > 1
+                and next(_sample_counter) % SAMPLE_RATE != 0
+            )
+
+            if not sampled_out and logger.isEnabledFor(level):
+                _emit_request_log(
+                    level, scope, path, method,
+                    elapsed_ns / 1e6, status_code, response_bytes, is_slow,
                 )
 
 
 # Export
-__all__ = ["RequestTimingMiddleware", "SLOW_THRESHOLD_MS"]
+__all__ = ["RequestTimingMiddleware", "SLOW_THRESHOLD_MS", "SAMPLE_RATE"]
@@ -30,6 +30,7 @@ Environment Variables:
     APPLICATIONINSIGHTS_CONNECTION_STRING: Enable App Insights telemetry
     GEOTILER_ENABLE_OBSERVABILITY: Enable detailed request/latency logging (default: false)
     GEOTILER_OBS_SLOW_THRESHOLD_MS: Slow request threshold in ms (default: 2000)
+    GEOTILER_OBS_SAMPLE_RATE: Log 1 in N successful non-slow requests (default: 1)
     GEOTILER_OBS_SERVICE_NAME: Service name for correlation (default: geotiler)
     GEOTILER_OBS_ENVIRONMENT: Deployment environment (default: dev)
 """
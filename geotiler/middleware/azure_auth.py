@@ -2,15 +2,20 @@
 Azure authentication middleware (pure ASGI).
 
 Ensures Azure Storage OAuth authentication is configured before each request.
+GDAL/obstore are configured once per token (startup + background refresh), so
+while the cached token is valid the middleware is a pass-through.
+
 Uses pure ASGI middleware instead of Starlette's BaseHTTPMiddleware to avoid
 the known exception-swallowing bug (encode/starlette#1012).
 """
 
 import logging
+import re
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from geotiler.config import settings
+from geotiler.config import settings, TOKEN_REFRESH_BUFFER_SECS
+from geotiler.auth.cache import storage_token_cache
 from geotiler.auth.storage import (
     get_storage_oauth_token_async,
     configure_storage_auth,
@@ -28,6 +33,11 @@ _SKIP_AUTH_PREFIXES = (
     "/admin",            # uses its own Azure AD auth
 )
 
+# Single compiled prefix matcher (same semantics as str.startswith(tuple))
+_skip_auth_match = re.compile(
+    "|".join(re.escape(prefix) for prefix in _SKIP_AUTH_PREFIXES)
+).match
+
 
 class AzureAuthMiddleware:
     """
@@ -38,6 +48,11 @@ class AzureAuthMiddleware:
     - obstore: AZURE_STORAGE_ACCOUNT_NAME + AZURE_STORAGE_TOKEN (for abfs:// Zarr access)
 
     Skips paths that don't access storage (health probes, static files, docs).
+
+    The token is configured by initialize_storage_auth() at startup and by the
+    background refresh task thereafter. Per-request work only happens when the
+    cached token is missing or inside the refresh buffer (e.g. a failed
+    background refresh), in which case it is re-acquired and reconfigured here.
     """
 
     def __init__(self, app: ASGIApp) -> None:
@@ -51,17 +66,25 @@ class AzureAuthMiddleware:
         path: str = scope.get("path", "")
 
         # Fast path: skip auth for non-storage endpoints
-        if path.startswith(_SKIP_AUTH_PREFIXES):
+        if _skip_auth_match(path):
             await self.app(scope, receive, send)
             return
 
         if settings.enable_storage_auth and settings.storage_account:
+            # Hot path: token already configured and not expiring soon.
+            # Read without the async lock - no await between check and use.
+            if storage_token_cache.get_if_valid_unlocked(
+                min_ttl_seconds=TOKEN_REFRESH_BUFFER_SECS
+            ):
+                await self.app(scope, receive, send)
+                return
+
             try:
                 token = await get_storage_oauth_token_async()
 
                 if token:
                     configure_storage_auth(token)
-                    logger.debug(f"Auth configured, token length: {len(token)} chars")
+                    logger.debug("Auth configured, token length: %d chars", len(token))
                 else:
                     logger.warning("No OAuth token available for request")
 
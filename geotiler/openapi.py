@@ -46,6 +46,13 @@ _STAC_DESCRIPTIONS: dict[str, dict[str, str]] = {
     },
 }
 
+# Flattened (path, method) -> summary for a single dict lookup per operation
+_STAC_DESC_FLAT: dict[tuple[str, str], str] = {
+    (path, method): summary
+    for path, methods in _STAC_DESCRIPTIONS.items()
+    for method, summary in methods.items()
+}
+
 # TiPG umbrella tag to strip (endpoints already have specific sub-tags)
 _TIPG_UMBRELLA_TAG = "OGC Vector (TiPG)"
 
@@ -56,66 +63,109 @@ _TIPG_TAG_RENAMES: dict[str, str] = {
     "OGC Common": "OGC Vector -- Common",
 }
 
+# Sub-tag keys as a frozenset for C-level membership / isdisjoint tests
+_TIPG_SUB_KEYS: frozenset[str] = frozenset(_TIPG_TAG_RENAMES)
+
+# Every TiPG tag (umbrella + sub-tags): one isdisjoint() gates the rewrite
+_TIPG_ALL_TAGS: frozenset[str] = _TIPG_SUB_KEYS | {_TIPG_UMBRELLA_TAG}
+
+# Display name for umbrella-only operations (no specific sub-tag)
+_TIPG_UMBRELLA_FALLBACK = "OGC Vector -- Common"
+
+# Filter Extension queryables endpoints (always grouped under STAC Catalog)
+_STAC_QUERYABLES_PATHS = frozenset((
+    "/stac/queryables",
+    "/stac/collections/{collection_id}/queryables",
+))
+
+# Map viewer routes whose upstream summary wrongly says TileJSON
+_MAP_VIEWER_SUFFIXES = ("/map.html", "/map")
+
+# Tags / path prefixes that can trigger a fix (anything else is left as-is)
+_TAG_FIX_TRIGGERS: frozenset[str] = _TIPG_ALL_TAGS | {"Liveliness/Readiness"}
+_PATH_FIX_PREFIXES = ("/stac", "/api")
+
+# HTTP methods that carry operations (skip "parameters", "summary", ...)
+_OPERATION_METHODS = frozenset(("get", "post", "put", "patch", "delete"))
+
 
 def _fix_operation(path: str, method: str, operation: dict) -> None:
     """Apply all fixes to a single operation."""
     tags = operation.get("tags", [])
 
-    # --- A. Deduplicate tags ------------------------------------------------
-    if len(tags) != len(set(tags)):
-        tags = list(dict.fromkeys(tags))
-        operation["tags"] = tags
-
-    # --- B. Tag untagged STAC endpoints ------------------------------------
-    if path.startswith("/stac") and (not tags or tags == ["default"]):
-        operation["tags"] = ["STAC Catalog"]
-        tags = operation["tags"]
-
-    # --- C. Fix "Liveliness" typo (stac-fastapi _mgmt endpoints) -----------
+    # Early exit: most operations are plain app/tiler routes with one
+    # ordinary tag, where none of the blocks below would change anything
+    if (
+        len(tags) == 1
+        and tags[0] not in _TAG_FIX_TRIGGERS
+        and not path.startswith(_PATH_FIX_PREFIXES)
+        and not path.endswith(_MAP_VIEWER_SUFFIXES)
+    ):
+        return
+
+    # --- A. Deduplicate tags + fix vector double-listing --------------------
+    # Most operations carry a single non-TiPG tag: detect that without
+    # allocating, and only rebuild the list when something must change.
+    if tags:
+        has_tipg = not _TIPG_ALL_TAGS.isdisjoint(tags)
+        has_dup = len(tags) > 1 and len(set(tags)) != len(tags)
+        if has_tipg or has_dup:
+            has_sub = has_tipg and not _TIPG_SUB_KEYS.isdisjoint(tags)
+            # One pass: skip duplicates, drop the TiPG umbrella when a
+            # specific sub-tag exists (otherwise rename it to the generic
+            # Common tag), and rename sub-tags to display names.
+            seen: set[str] = set()
+            new_tags: list[str] = []
+            for tag in tags:
+                if tag == _TIPG_UMBRELLA_TAG:
+                    if has_sub:
+                        continue
+                    tag = _TIPG_UMBRELLA_FALLBACK
+                else:
+                    tag = _TIPG_TAG_RENAMES.get(tag, tag)
+                if tag not in seen:
+                    seen.add(tag)
+                    new_tags.append(tag)
+            tags = new_tags
+            operation["tags"] = tags
+
+    # --- B. Fix "Liveliness" typo (stac-fastapi _mgmt endpoints) -----------
     if "Liveliness/Readiness" in tags:
         operation["tags"] = ["STAC Catalog"]
         tags = operation["tags"]
 
-    # --- D. Fix vector double-listing (strip umbrella, rename sub-tags) ----
-    if _TIPG_UMBRELLA_TAG in tags:
-        # Check if there's also a specific sub-tag
-        has_sub = any(t in _TIPG_TAG_RENAMES for t in tags)
-        if has_sub:
-            tags = [t for t in tags if t != _TIPG_UMBRELLA_TAG]
-        else:
-            # No sub-tag — keep umbrella but rename to generic
-            tags = [
-                "OGC Vector -- Common" if t == _TIPG_UMBRELLA_TAG else t
-                for t in tags
-            ]
-        operation["tags"] = tags
-
-    # Rename TiPG sub-tags
-    if any(t in _TIPG_TAG_RENAMES for t in tags):
-        operation["tags"] = [_TIPG_TAG_RENAMES.get(t, t) for t in tags]
-        tags = operation["tags"]
+    # Remaining fixes are path-specific: dispatch on the first path segment
+    end = path.find("/", 1)
+    first_segment = path[1:end] if end != -1 else path[1:]
 
-    # --- E. Fix STAC generic descriptions ----------------------------------
-    desc = operation.get("summary", "") or operation.get("description", "")
-    if path in _STAC_DESCRIPTIONS and method in _STAC_DESCRIPTIONS[path]:
-        if not desc or desc.strip().rstrip(".") in ("Endpoint", ""):
-            operation["summary"] = _STAC_DESCRIPTIONS[path][method]
+    if first_segment == "stac":
+        # --- C. Tag untagged STAC endpoints --------------------------------
+        if not tags or tags == ["default"]:
+            operation["tags"] = ["STAC Catalog"]
+            tags = operation["tags"]
+
+        # --- D. Fix STAC generic descriptions ------------------------------
+        stac_summary = _STAC_DESC_FLAT.get((path, method))
+        if stac_summary:
+            desc = operation.get("summary", "") or operation.get("description", "")
+            if not desc or desc.strip().rstrip(".") in ("Endpoint", ""):
+                operation["summary"] = stac_summary
 
-    # --- F. Fix map viewer descriptions ------------------------------------
-    if path.endswith("/map.html") or path.endswith("/map"):
+        # --- E. Tag Filter Extension queryables ----------------------------
+        if path in _STAC_QUERYABLES_PATHS and "STAC Catalog" not in tags:
+            operation["tags"] = ["STAC Catalog"]
+
+    elif first_segment == "api":
+        # --- F. Move GET /api from Admin to API Info -----------------------
+        if path == "/api" and method == "get":
+            operation["tags"] = ["API Info"]
+
+    # --- G. Fix map viewer descriptions (tiler routers) --------------------
+    elif path.endswith(_MAP_VIEWER_SUFFIXES):
         summary = operation.get("summary", "")
         if "TileJSON" in summary or "tilejson" in summary.lower():
             operation["summary"] = "Return an interactive map viewer (HTML page)."
 
-    # --- G. Move GET /api from Admin to API Info ---------------------------
-    if path == "/api" and method == "get":
-        operation["tags"] = ["API Info"]
-
-    # --- H. Tag Filter Extension queryables --------------------------------
-    if path in ("/stac/queryables", "/stac/collections/{collection_id}/queryables"):
-        if "STAC Catalog" not in tags:
-            operation["tags"] = ["STAC Catalog"]
-
 
 def customize_openapi(app: FastAPI) -> dict:
     """
@@ -138,7 +188,7 @@ def customize_openapi(app: FastAPI) -> dict:
     # Post-process every operation
     for path, path_item in schema.get("paths", {}).items():
         for method, operation in path_item.items():
-            if method in ("get", "post", "put", "patch", "delete"):
+            if method in _OPERATION_METHODS:
                 _fix_operation(path, method, operation)
 
     # Remove the umbrella tag definition if it exists
@@ -1,5 +1,23 @@
-"""FastAPI routers for health probes and custom endpoints."""
+"""FastAPI routers for health probes and custom endpoints.
 
-from geotiler.routers import health, admin, vector, stac, diagnostics, h3_explorer
+Router modules are imported lazily on first attribute access (PEP 562), so
+``import geotiler.routers`` does not pull in titiler/tipg/stac-fastapi for
+routers that are never used. ``from geotiler.routers import health`` works
+as before.
+"""
+
+import importlib
 
 __all__ = ["health", "admin", "vector", "stac", "diagnostics", "h3_explorer"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,26 +6,69 @@ Provides:
 - GET /api - JSON API information
 - GET /_health-fragment - HTMX partial for auto-refresh
 - POST /admin/refresh-collections - Webhook to refresh TiPG collection catalog
+- GET /admin/refresh-status/{job_id} - Status of a background catalog refresh
 """
 
+import asyncio
+import gzip
+import json
 import logging
+import time
+import uuid
 from datetime import datetime, timezone
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Request, Response
+from fastapi import APIRouter, Depends, FastAPI, Request, Response
 
 from geotiler.auth.roles import require_admin
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 
 from geotiler import __version__
-from geotiler.config import settings
-from geotiler.errors import error_response, TIPG_DISABLED, UPSTREAM_ERROR
-from geotiler.routers.health import health as get_health_data
-from geotiler.templates_utils import templates, get_template_context
+from geotiler.config import settings, ADMIN_HEALTH_TTL_SECS
+from geotiler.errors import error_response, NOT_FOUND, TIPG_DISABLED, UPSTREAM_ERROR
+from geotiler.routers.health import collect_health
+from geotiler.templates_utils import (
+    templates,
+    get_template_context,
+    etag_for,
+    not_modified,
+    render_cached_page,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Admin"])
 
+# Rendered admin shell (body, etag) per base URL, see render_cached_page()
+_admin_shell_cache: dict[str, tuple[bytes, str]] = {}
+
+# Serialized /api body as (identity, gzip, etag). Depends only on the
+# (cached) OpenAPI schema and settings, both fixed once the app is built, so
+# it is encoded and compressed once on first use.
+_api_info_body: Optional[tuple[bytes, bytes, str]] = None
+
+# Browser/CDN cache lifetime for the static shell and /api bodies
+_STATIC_CACHE_CONTROL = "max-age=60"
+
+# (monotonic timestamp, data) of the last health check, shared by all open
+# admin tabs; the lock coalesces concurrent polls into one upstream check
+_health_cache: Optional[tuple[float, dict]] = None
+_health_lock = asyncio.Lock()
+
+
+async def _get_cached_health_data(request: Request) -> dict:
+    """Return health data, re-running the checks at most every ADMIN_HEALTH_TTL_SECS."""
+    global _health_cache
+    async with _health_lock:
+        if _health_cache is not None:
+            cached_at, cached = _health_cache
+            if time.monotonic() - cached_at < ADMIN_HEALTH_TTL_SECS:
+                return cached
+
+        health_data, _ = await collect_health(request)
+        _health_cache = (time.monotonic(), health_data)
+        return health_data
+
 
 @router.get("/", response_class=HTMLResponse, include_in_schema=False)
 async def admin_console(request: Request):
@@ -40,12 +83,20 @@ async def admin_console(request: Request):
     - Issues list (if any)
 
     Auto-refreshes every 30 seconds via HTMX.
-    """
-    response = Response()
-    health_data = await get_health_data(request, response)
 
-    context = get_template_context(request, health=health_data, nav_active="/")
-    return templates.TemplateResponse("pages/admin/index.html", context)
+    Returns only the page shell; the health section is loaded by the
+    fragment's hx-trigger "load" request, so the shell is sent without
+    waiting on health checks (and health is computed once per page view,
+    not twice). The shell has no per-request data, so it is served via
+    render_cached_page().
+    """
+    return render_cached_page(
+        request,
+        "pages/admin/index.html",
+        _admin_shell_cache,
+        _STATIC_CACHE_CONTROL,
+        nav_active="/",
+    )
 
 
 @router.get("/_health-fragment", response_class=HTMLResponse, include_in_schema=False)
@@ -56,11 +107,13 @@ async def health_fragment(request: Request):
     Returns only the health content section (no navbar/footer).
     Called every 30 seconds when auto-refresh is enabled.
     """
-    response = Response()
-    health_data = await get_health_data(request, response)
+    health_data = await _get_cached_health_data(request)
 
     context = get_template_context(request, health=health_data)
-    return templates.TemplateResponse("pages/admin/_health_fragment.html", context)
+    # get_template() hits Jinja's compiled-template cache, and still reloads
+    # the file when GEOTILER_UI_TEMPLATE_AUTO_RELOAD is on
+    template = templates.get_template("pages/admin/_health_fragment.html")
+    return HTMLResponse(template.render(context))
 
 
 @router.get("/api")
@@ -69,8 +122,65 @@ async def api_info(request: Request):
     JSON API information endpoint.
 
     Returns API metadata and available endpoints derived from the OpenAPI schema.
+    The serialized body (and a gzip copy) is built once and served as static
+    bytes; clients sending ``Accept-Encoding: gzip`` get the compressed copy.
+    Conditional GETs matching the ETag get a bodiless 304.
     """
-    schema = request.app.openapi()
+    global _api_info_body
+    if _api_info_body is None:
+        body = json.dumps(
+            _build_api_info(request.app),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        _api_info_body = (body, gzip.compress(body, compresslevel=9), etag_for(body))
+
+    body, body_gzip, etag = _api_info_body
+    headers = {
+        "Vary": "Accept-Encoding",
+        "ETag": etag,
+        "Cache-Control": _STATIC_CACHE_CONTROL,
+    }
+    response = not_modified(request, etag, headers)
+    if response is not None:
+        return response
+
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        body = body_gzip
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows gzip.
+
+    An explicit ``gzip`` coding wins over ``*``; either is refused with q=0.
+    """
+    wildcard_q: Optional[float] = None
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "gzip":
+            return q > 0
+        wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
+def _build_api_info(app: FastAPI) -> dict:
+    """Build the /api payload from the app's OpenAPI schema and settings."""
+    schema = app.openapi()
 
     # Build endpoints dict: tag -> list of paths
     tag_paths: dict[str, list[str]] = {}
@@ -104,8 +214,19 @@ async def api_info(request: Request):
     }
 
 
+# Background catalog refresh jobs (POST /admin/refresh-collections?wait=false),
+# oldest evicted beyond the cap. Tasks are referenced until done so they are
+# not garbage-collected mid-refresh.
+_REFRESH_JOBS_MAX = 32
+_refresh_jobs: dict[str, dict] = {}
+_refresh_tasks: set[asyncio.Task] = set()
+
+# In-flight catalog refresh shared by concurrent webhook calls (singleflight)
+_refresh_inflight: Optional[asyncio.Task] = None
+
+
 @router.post("/admin/refresh-collections", dependencies=[Depends(require_admin)])
-async def refresh_collections(request: Request):
+async def refresh_collections(request: Request, wait: bool = True):
     """
     Webhook to refresh TiPG collection catalog.
 
@@ -115,6 +236,12 @@ async def refresh_collections(request: Request):
 
     This is the recommended integration point for Orchestrator/ETL apps.
 
+    Args:
+        wait: If true (default), refresh inline and return the result below.
+            If false, start the refresh in the background and return
+            202 Accepted with a job_id to poll at
+            GET /admin/refresh-status/{job_id}.
+
     Returns:
         - status: "success" or "error"
         - collections_before: Number of collections before refresh
@@ -130,50 +257,33 @@ async def refresh_collections(request: Request):
             hint="Set GEOTILER_ENABLE_TIPG=true to enable vector tile support",
         )
 
-    # Import here to avoid circular imports
-    from geotiler.routers.vector import (
-        refresh_tipg_pool,
-        get_tipg_startup_state_from_app,
-    )
-
     app = request.app
 
-    # Get current state before refresh
-    state_before = get_tipg_startup_state_from_app(app)
-    collections_before = []
-    if state_before:
-        collections_before = state_before.collection_ids.copy()
-
-    logger.info("Webhook triggered: refreshing TiPG collection catalog...")
-
-    try:
-        # Perform the refresh
-        await refresh_tipg_pool(app)
-
-        # Get state after refresh
-        state_after = get_tipg_startup_state_from_app(app)
-        collections_after = []
-        if state_after:
-            collections_after = state_after.collection_ids.copy()
-
-        # Calculate diff
-        new_collections = [c for c in collections_after if c not in collections_before]
-        removed_collections = [c for c in collections_before if c not in collections_after]
-
-        logger.info(
-            f"Catalog refresh complete: {len(collections_before)} -> {len(collections_after)} collections "
-            f"(+{len(new_collections)}, -{len(removed_collections)})"
-        )
-
-        return {
-            "status": "success",
-            "collections_before": len(collections_before),
-            "collections_after": len(collections_after),
-            "new_collections": new_collections,
-            "removed_collections": removed_collections,
-            "refresh_time": datetime.now(timezone.utc).isoformat(),
+    if not wait:
+        job_id = uuid.uuid4().hex
+        _refresh_jobs[job_id] = {
+            "job_id": job_id,
+            "status": "running",
+            "started_at": datetime.now(timezone.utc).isoformat(),
         }
+        while len(_refresh_jobs) > _REFRESH_JOBS_MAX:
+            del _refresh_jobs[next(iter(_refresh_jobs))]
+
+        task = asyncio.create_task(_run_refresh_job(app, job_id))
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+        return JSONResponse(
+            {
+                "status": "accepted",
+                "job_id": job_id,
+                "status_url": f"/admin/refresh-status/{job_id}",
+            },
+            status_code=202,
+        )
 
+    try:
+        return await _refresh_catalog_shared(app)
     except Exception as e:
         logger.error(f"Catalog refresh failed: {e}")
         return error_response(
@@ -182,3 +292,121 @@ async def refresh_collections(request: Request):
             UPSTREAM_ERROR,
             refresh_time=datetime.now(timezone.utc).isoformat(),
         )
+
+
+@router.get("/admin/refresh-status/{job_id}", dependencies=[Depends(require_admin)])
+async def refresh_status(job_id: str):
+    """
+    Status of a background catalog refresh started with ``wait=false``.
+
+    Returns the job record: ``status`` is "running" until the refresh ends,
+    then the same fields as a synchronous refresh-collections response.
+    """
+    job = _refresh_jobs.get(job_id)
+    if job is None:
+        return error_response(f"Unknown refresh job: {job_id}", 404, NOT_FOUND)
+    return job
+
+
+async def _run_refresh_job(app: FastAPI, job_id: str) -> None:
+    """Run a catalog refresh in the background and record its result."""
+    try:
+        result = await _refresh_catalog_shared(app)
+    except Exception as e:
+        logger.error(f"Catalog refresh job {job_id} failed: {e}")
+        result = {
+            "status": "error",
+            "error": str(e),
+            "refresh_time": datetime.now(timezone.utc).isoformat(),
+        }
+
+    job = _refresh_jobs.get(job_id)
+    if job is not None:  # may have been evicted while running
+        job.update(result)
+
+
+async def _refresh_catalog_shared(app: FastAPI) -> dict:
+    """
+    Run _refresh_catalog(), joining the in-flight refresh if there is one.
+
+    ETL batches often fire the webhook several times at once; N concurrent
+    calls now cost one pool refresh + catalog scan and all get its result.
+    The shared task is shielded so one caller disconnecting does not cancel
+    the refresh for the others.
+    """
+    global _refresh_inflight
+
+    task = _refresh_inflight
+    if task is None:
+        task = asyncio.create_task(_refresh_catalog(app))
+        _refresh_inflight = task
+        task.add_done_callback(_clear_refresh_inflight)
+    else:
+        logger.info("Catalog refresh already in progress, joining it")
+
+    return await asyncio.shield(task)
+
+
+def _clear_refresh_inflight(task: asyncio.Task) -> None:
+    """Done-callback: allow the next webhook call to start a fresh refresh."""
+    global _refresh_inflight
+    if _refresh_inflight is task:
+        _refresh_inflight = None
+
+
+# geotiler.routers.vector, bound on first refresh (deferred to avoid
+# circular imports; later calls skip the import machinery)
+_vector = None
+
+
+def _vector_module():
+    """Return the vector router module, importing it once."""
+    global _vector
+    if _vector is None:
+        from geotiler.routers import vector
+        _vector = vector
+    return _vector
+
+
+async def _refresh_catalog(app: FastAPI) -> dict:
+    """
+    Refresh the TiPG pool/catalog and diff collection IDs before and after.
+
+    Raises:
+        Exception: If the refresh fails.
+    """
+    vector = _vector_module()
+
+    # Get current state before refresh (refresh replaces the list, so
+    # holding a reference is enough - no copy needed)
+    state_before = vector.get_tipg_startup_state_from_app(app)
+    collections_before = state_before.collection_ids if state_before else []
+
+    logger.info("Webhook triggered: refreshing TiPG collection catalog...")
+
+    # Perform the refresh
+    await vector.refresh_tipg_pool(app)
+
+    # Get state after refresh
+    state_after = vector.get_tipg_startup_state_from_app(app)
+    collections_after = state_after.collection_ids if state_after else []
+
+    # Calculate diff (set membership, list order preserved)
+    before_set = set(collections_before)
+    after_set = set(collections_after)
+    new_collections = [c for c in collections_after if c not in before_set]
+    removed_collections = [c for c in collections_before if c not in after_set]
+
+    logger.info(
+        f"Catalog refresh complete: {len(collections_before)} -> {len(collections_after)} collections "
+        f"(+{len(new_collections)}, -{len(removed_collections)})"
+    )
+
+    return {
+        "status": "success",
+        "collections_before": len(collections_before),
+        "collections_after": len(collections_after),
+        "new_collections": new_collections,
+        "removed_collections": removed_collections,
+        "refresh_time": datetime.now(timezone.utc).isoformat(),
+    }
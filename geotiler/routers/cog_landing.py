@@ -5,13 +5,20 @@ Provides an interactive landing page for exploring Cloud Optimized GeoTIFFs.
 """
 
 from fastapi import APIRouter, Request
+from fastapi.responses import HTMLResponse
 
-from geotiler.templates_utils import render_template
+from geotiler.templates_utils import render_cached_page
 
 router = APIRouter(tags=["Landing Pages"])
 
+# Rendered page (body, etag) per base URL, see render_cached_page()
+_page_cache: dict[str, tuple[bytes, str]] = {}
 
-@router.get("/cog/", include_in_schema=False)
+# Page only changes with a new image (version), so let browsers/CDNs keep it
+_CACHE_CONTROL = "public, max-age=300"
+
+
+@router.get("/cog/", response_class=HTMLResponse, include_in_schema=False)
 async def cog_landing(request: Request):
     """
     COG Explorer landing page.
@@ -21,9 +28,10 @@ async def cog_landing(request: Request):
     - Quick action buttons (info, viewer, tilejson, statistics)
     - Sample COG URLs
     - Endpoint reference
+
+    The page has no per-request data, so it is served via
+    render_cached_page().
     """
-    return render_template(
-        request,
-        "pages/cog/landing.html",
-        nav_active="/cog/"
+    return render_cached_page(
+        request, "pages/cog/landing.html", _page_cache, _CACHE_CONTROL, nav_active="/cog/"
     )
@@ -27,7 +27,7 @@ from typing import Optional, Tuple
 from fastapi import APIRouter, Request, Response
 
 from geotiler import __version__
-from geotiler.config import settings, READYZ_MIN_TTL_SECS
+from geotiler.config import settings, READYZ_MIN_TTL_SECS, HARDWARE_INFO_TTL_SECS
 from geotiler.auth.cache import (
     storage_token_cache,
     postgres_token_cache,
@@ -144,6 +144,17 @@ async def health(request: Request, response: Response):
         - healthy: All systems operational (HTTP 200)
         - degraded: App running but some features unavailable (HTTP 503)
     """
+    health_data, response.status_code = await collect_health(request)
+    return health_data
+
+
+async def collect_health(request: Request) -> Tuple[dict, int]:
+    """
+    Run the /health checks and return (payload, HTTP status code).
+
+    Used directly by the HTML dashboards, which render the payload and
+    ignore the status code (HTMX does not swap 5xx responses).
+    """
     health_start = time.monotonic()
     services = {}
     dependencies = {}
@@ -194,7 +205,7 @@ async def health(request: Request, response: Response):
             dependencies["storage_oauth"] = {
                 "status": "ok" if ttl > 300 else "warning",
                 "expires_in_seconds": ttl,
-                "storage_account": settings.storage_account,
+                "storage_account": settings.storage_account or None,
                 "required_by": ["cog", "xarray"],
             }
             if ttl <= 300:
@@ -202,7 +213,7 @@ async def health(request: Request, response: Response):
         else:
             dependencies["storage_oauth"] = {
                 "status": "fail",
-                "storage_account": settings.storage_account,
+                "storage_account": settings.storage_account or None,
                 "required_by": ["cog", "xarray"],
             }
             issues.append("Storage OAuth token not initialized")
@@ -446,16 +457,16 @@ async def health(request: Request, response: Response):
 
     if not issues:
         overall_status = "healthy"
-        response.status_code = 200
+        status_code = 200
     elif all_critical_down:
         overall_status = "unhealthy"
-        response.status_code = 503
+        status_code = 503
     elif has_critical_failure:
         overall_status = "degraded"
-        response.status_code = 503
+        status_code = 503
     else:
         overall_status = "healthy"  # Warnings but functional
-        response.status_code = 200
+        status_code = 200
 
     # =========================================================================
     # RESPONSE
@@ -488,7 +499,7 @@ async def health(request: Request, response: Response):
             "tipg_schemas": settings.tipg_schema_list if settings.enable_tipg else None,
             "stac_api_enabled": settings.enable_stac_api,
         },
-    }
+    }, status_code
 
 
 def _check_token_ready(cache: TokenCache, name: str) -> Tuple[bool, str]:
@@ -559,13 +570,37 @@ def _build_service_status(
     return result
 
 
+# (monotonic timestamp, result) of the last successful _get_hardware_info()
+_hardware_info_cache: Optional[Tuple[float, dict]] = None
+
+
 def _get_hardware_info() -> dict:
     """
     Get hardware and runtime environment info.
 
+    The psutil snapshot (which samples CPU for 100ms) is cached for
+    HARDWARE_INFO_TTL_SECS so concurrent /health and admin fragment polls
+    share one reading.
+
     Returns:
         Dict with CPU, memory, and Azure environment details.
     """
+    global _hardware_info_cache
+
+    now = time.monotonic()
+    if _hardware_info_cache is not None:
+        cached_at, cached = _hardware_info_cache
+        if now - cached_at < HARDWARE_INFO_TTL_SECS:
+            return cached
+
+    info = _collect_hardware_info()
+    if "error" not in info:
+        _hardware_info_cache = (now, info)
+    return info
+
+
+def _collect_hardware_info() -> dict:
+    """Read hardware and runtime environment info from psutil and env vars."""
     try:
         import psutil
 
@@ -5,11 +5,11 @@ Serves the system health monitoring dashboard with auto-refreshing
 HTMX fragments for live service status.
 """
 
-from fastapi import APIRouter, Request, Response
+from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
 from geotiler.templates_utils import render_template, templates, get_template_context
-from geotiler.routers.health import health as get_health_data
+from geotiler.routers.health import collect_health
 
 router = APIRouter(tags=["System"], include_in_schema=False)
 
@@ -23,7 +23,6 @@ async def system_page(request: Request):
 @router.get("/system/_health-fragment", response_class=HTMLResponse, include_in_schema=False)
 async def system_health_fragment(request: Request):
     """HTMX fragment: renders live health data into the system page."""
-    response = Response()
-    health_data = await get_health_data(request, response)
+    health_data, _ = await collect_health(request)
     context = get_template_context(request, health=health_data)
     return templates.TemplateResponse("pages/system/_health_fragment.html", context)
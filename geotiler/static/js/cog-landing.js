@@ -0,0 +1,29 @@
+/**
+ * COG Explorer landing page JavaScript for geotiler.
+ *
+ * Quick actions that open titiler endpoints for the URL in #cog-url.
+ */
+
+function getInfo() {
+    const url = document.getElementById('cog-url').value;
+    if (!url) { alert('Please enter a COG URL'); return; }
+    window.location.href = '/cog/info?url=' + encodeURIComponent(url);
+}
+
+function openViewer() {
+    const url = document.getElementById('cog-url').value;
+    if (!url) { alert('Please enter a COG URL'); return; }
+    window.location.href = '/cog/WebMercatorQuad/map?url=' + encodeURIComponent(url);
+}
+
+function getTileJSON() {
+    const url = document.getElementById('cog-url').value;
+    if (!url) { alert('Please enter a COG URL'); return; }
+    window.location.href = '/cog/WebMercatorQuad/tilejson.json?url=' + encodeURIComponent(url);
+}
+
+function getStatistics() {
+    const url = document.getElementById('cog-url').value;
+    if (!url) { alert('Please enter a COG URL'); return; }
+    window.location.href = '/cog/statistics?url=' + encodeURIComponent(url);
+}
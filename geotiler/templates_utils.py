@@ -5,19 +5,85 @@ Provides a centralized Jinja2Templates instance and helper functions
 for rendering templates across all routers.
 """
 
+import hashlib
+import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import Request
+from fastapi import Request, Response
+from fastapi.responses import HTMLResponse
+from jinja2 import FileSystemBytecodeCache
 from starlette.templating import Jinja2Templates
 
 from geotiler import __version__
 from geotiler.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Initialize templates directory
 _templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=_templates_dir)
 
+# Templates ship with the image: skip the per-render mtime check. The
+# bytecode cache is attached at startup by precompile_templates().
+if not settings.ui_template_auto_reload:
+    templates.env.auto_reload = False
+
+# Admin console templates (and the layout/macros they pull in) compiled at
+# startup so the first HTMX poll on each worker doesn't pay the compile cost
+_PRECOMPILED_TEMPLATES = (
+    "base.html",
+    "components/navbar.html",
+    "components/footer.html",
+    "components/macros.html",
+    "pages/admin/index.html",
+    "pages/admin/_health_fragment.html",
+)
+
+
+def _configure_bytecode_cache() -> None:
+    """
+    Reuse compiled template bytecode across worker processes/restarts.
+
+    Only when auto-reload is off. Uses GEOTILER_UI_TEMPLATE_BYTECODE_DIR
+    (default: system temp dir); if that directory can't be created or
+    written, templates are compiled in memory only.
+    """
+    if settings.ui_template_auto_reload or templates.env.bytecode_cache is not None:
+        return
+
+    directory = settings.ui_template_bytecode_dir or tempfile.gettempdir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        writable = os.access(directory, os.W_OK | os.X_OK)
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled: {e}")
+        return
+    if not writable:
+        logger.warning(f"Template bytecode cache disabled: {directory} is not writable")
+        return
+
+    templates.env.bytecode_cache = FileSystemBytecodeCache(directory)
+
+
+def precompile_templates() -> None:
+    """Attach the bytecode cache and load the admin templates into the Jinja cache."""
+    _configure_bytecode_cache()
+    for name in _PRECOMPILED_TEMPLATES:
+        templates.env.get_template(name)
+
+
+# Request-invariant context (version + settings are fixed for the process)
+_STATIC_CONTEXT: Dict[str, Any] = {
+    "version": __version__,
+    "stac_api_enabled": settings.enable_stac_api and settings.enable_tipg,
+    "tipg_enabled": settings.enable_tipg,
+    # Sample URLs from configuration
+    "sample_zarr_urls": settings.sample_zarr_urls,
+}
+
 
 def get_template_context(request: Request, **kwargs: Any) -> Dict[str, Any]:
     """
@@ -30,14 +96,7 @@ def get_template_context(request: Request, **kwargs: Any) -> Dict[str, Any]:
     Returns:
         Dictionary with standard context variables plus any extras
     """
-    context = {
-        "request": request,
-        "version": __version__,
-        "stac_api_enabled": settings.enable_stac_api and settings.enable_tipg,
-        "tipg_enabled": settings.enable_tipg,
-        # Sample URLs from configuration
-        "sample_zarr_urls": settings.sample_zarr_urls,
-    }
+    context = {**_STATIC_CONTEXT, "request": request}
     context.update(kwargs)
     return context
 
@@ -60,3 +119,80 @@ def render_template(
     """
     context = get_template_context(request, **kwargs)
     return templates.TemplateResponse(template_name, context)
+
+
+def etag_for(body: bytes) -> str:
+    """Weak ETag for a cached page body (also valid for its gzip variant)."""
+    return 'W/"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+
+def not_modified(request: Request, etag: str, headers: Dict[str, str]) -> Optional[Response]:
+    """
+    Return a 304 response if the client's If-None-Match covers ``etag``.
+
+    Args:
+        request: The FastAPI request object
+        etag: ETag of the current body (from etag_for)
+        headers: Headers to send with the 304 (ETag, Cache-Control, ...)
+
+    Returns:
+        304 Response, or None if the body should be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    opaque = etag.removeprefix("W/")
+    if if_none_match.strip() == "*" or opaque in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+# Max cached renders per page. Keyed by request base URL (the only
+# per-request input: url_for() emits absolute static URLs); bounded because
+# the Host header is client-controlled.
+_PAGE_CACHE_MAX = 8
+
+
+def render_cached_page(
+    request: Request,
+    template_name: str,
+    cache: Dict[str, Tuple[bytes, str]],
+    cache_control: str,
+    **kwargs: Any,
+) -> Response:
+    """
+    Render a page with no per-request data once per base URL.
+
+    The UTF-8 body and its ETag are kept in ``cache`` (owned by the calling
+    router) and served from bytes thereafter; repeat visits revalidate with a
+    bodiless 304. Nothing is cached while template auto-reload is on, so
+    template edits show up.
+
+    Args:
+        request: The FastAPI request object
+        template_name: Name of the template file
+        cache: Per-page dict of base URL -> (body, etag)
+        cache_control: Cache-Control header value
+        **kwargs: Additional context variables
+
+    Returns:
+        HTMLResponse, or a 304 Response if the client's copy is current
+    """
+    base_url = str(request.base_url)
+    cached = cache.get(base_url)
+    if cached is None:
+        context = get_template_context(request, **kwargs)
+        body = templates.get_template(template_name).render(context).encode("utf-8")
+        cached = (body, etag_for(body))
+        if not settings.ui_template_auto_reload and len(cache) < _PAGE_CACHE_MAX:
+            cache[base_url] = cached
+
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    response = not_modified(request, etag, headers)
+    if response is not None:
+        return response
+
+    return HTMLResponse(content=body, headers=headers)